@@ -1,29 +1,51 @@
-from fastapi import FastAPI, APIRouter, HTTPException, Depends, status
+from fastapi import FastAPI, APIRouter, HTTPException, Depends, Query, Request, Response, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
+from fastapi.responses import ORJSONResponse
 from dotenv import load_dotenv
 from starlette.middleware.cors import CORSMiddleware
+from starlette.middleware.gzip import GZipMiddleware
 from motor.motor_asyncio import AsyncIOMotorClient
+from pymongo.errors import DuplicateKeyError
 import os
+import asyncio
 import logging
 from pathlib import Path
 from pydantic import BaseModel, Field, EmailStr
-from typing import List, Optional
+from typing import List, Optional, Tuple
 import uuid
+import time
+import hashlib
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 import bcrypt
 import jwt
+from cachetools import TTLCache
 from enum import Enum
+from types import MappingProxyType
 
 ROOT_DIR = Path(__file__).parent
 load_dotenv(ROOT_DIR / '.env')
 
 # MongoDB connection
 mongo_url = os.environ['MONGO_URL']
-client = AsyncIOMotorClient(mongo_url)
+client = AsyncIOMotorClient(
+    mongo_url,
+    maxPoolSize=int(os.environ.get('MONGO_MAX_POOL_SIZE', 200)),
+    minPoolSize=int(os.environ.get('MONGO_MIN_POOL_SIZE', 10)),
+    # Unavailable compressors are skipped by the driver with a warning
+    compressors=os.environ.get('MONGO_COMPRESSORS', 'zstd,snappy'),
+    retryWrites=True,
+    serverSelectionTimeoutMS=3000
+)
 db = client[os.environ['DB_NAME']]
 
 # Create the main app without a prefix
-app = FastAPI(title="Fitness Tracker API", description="Comprehensive fitness and nutrition tracking system")
+app = FastAPI(
+    title="Fitness Tracker API",
+    description="Comprehensive fitness and nutrition tracking system",
+    default_response_class=ORJSONResponse
+)
 
 # Create a router with the /api prefix
 api_router = APIRouter(prefix="/api")
@@ -32,6 +54,32 @@ api_router = APIRouter(prefix="/api")
 security = HTTPBearer()
 JWT_SECRET = os.environ.get('JWT_SECRET', 'your-secret-key-here')
 JWT_ALGORITHM = "HS256"
+BCRYPT_ROUNDS = int(os.environ.get('BCRYPT_ROUNDS', 10))
+
+# bcrypt releases the GIL, so a dedicated thread pool gives real parallelism without
+# competing with the default executor that Starlette uses for sync code
+_crypto_executor = ThreadPoolExecutor(max_workers=os.cpu_count() or 1, thread_name_prefix="crypto")
+
+# Pagination for list endpoints; the catalog and day-log pickers load in one request,
+# so those default to the maximum page
+DEFAULT_PAGE_SIZE = 100
+MAX_PAGE_SIZE = 1000
+
+# Verified tokens, keyed by SHA-256 of the raw token -> (user_id, exp)
+_jwt_cache = TTLCache(maxsize=10000, ttl=30)
+
+# Catalog documents by id, read on every meal/workout log
+FOOD_ITEM_LOG_FIELDS = {
+    "_id": 0, "name": 1, "calories_per_100g": 1, "protein_per_100g": 1, "carbs_per_100g": 1, "fat_per_100g": 1
+}
+EXERCISE_LOG_FIELDS = {"_id": 0, "name": 1, "calories_per_minute": 1}
+_food_cache = TTLCache(maxsize=10000, ttl=300)
+_exercise_cache = TTLCache(maxsize=10000, ttl=300)
+
+# Catalog versions by collection name, backing the ETags of the catalog list endpoints.
+# Dropped on local writes; the TTL bounds staleness from writes made by other workers.
+_catalog_versions = TTLCache(maxsize=16, ttl=60)
+CATALOG_CACHE_CONTROL = "private, max-age=60, must-revalidate"
 
 # Enums
 class GoalType(str, Enum):
@@ -53,6 +101,16 @@ class ExerciseType(str, Enum):
     FLEXIBILITY = "flexibility"
     SPORTS = "sports"
 
+# Keyed by wire value; str-enum members hash and compare as their value, so both
+# ActivityLevel members and raw strings from Mongo hit the same entry
+ACTIVITY_MULTIPLIERS = MappingProxyType({
+    ActivityLevel.SEDENTARY.value: 1.2,
+    ActivityLevel.LIGHTLY_ACTIVE.value: 1.375,
+    ActivityLevel.MODERATELY_ACTIVE.value: 1.55,
+    ActivityLevel.VERY_ACTIVE.value: 1.725,
+    ActivityLevel.EXTREMELY_ACTIVE.value: 1.9
+})
+
 # User Models
 class UserCreate(BaseModel):
     username: str
@@ -70,7 +128,7 @@ class UserLogin(BaseModel):
     password: str
 
 class User(BaseModel):
-    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    id: str = Field(default_factory=lambda: uuid.uuid4().hex)
     username: str
     email: str
     full_name: str
@@ -95,9 +153,11 @@ class UserProfile(BaseModel):
     bmi: float
     daily_calories: int
 
+USER_PROFILE_FIELDS = {"_id": 0, **{field: 1 for field in UserProfile.model_fields}}
+
 # Food and Nutrition Models
 class FoodItem(BaseModel):
-    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    id: str = Field(default_factory=lambda: uuid.uuid4().hex)
     name: str
     calories_per_100g: float
     protein_per_100g: float
@@ -115,7 +175,7 @@ class FoodItemCreate(BaseModel):
     fiber_per_100g: Optional[float] = 0
 
 class MealEntry(BaseModel):
-    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    id: str = Field(default_factory=lambda: uuid.uuid4().hex)
     user_id: str
     food_item_id: str
     food_name: str
@@ -134,7 +194,7 @@ class MealEntryCreate(BaseModel):
 
 # Workout Models
 class Exercise(BaseModel):
-    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    id: str = Field(default_factory=lambda: uuid.uuid4().hex)
     name: str
     type: ExerciseType
     muscle_groups: List[str]
@@ -152,7 +212,7 @@ class ExerciseCreate(BaseModel):
     calories_per_minute: float
 
 class WorkoutEntry(BaseModel):
-    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    id: str = Field(default_factory=lambda: uuid.uuid4().hex)
     user_id: str
     exercise_id: str
     exercise_name: str
@@ -174,7 +234,7 @@ class WorkoutEntryCreate(BaseModel):
 
 # Goal Models
 class Goal(BaseModel):
-    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    id: str = Field(default_factory=lambda: uuid.uuid4().hex)
     user_id: str
     goal_type: GoalType
     target_weight: Optional[float] = None
@@ -191,7 +251,7 @@ class GoalCreate(BaseModel):
 
 # Utility functions
 def hash_password(password: str) -> str:
-    return bcrypt.hashpw(password.encode('utf-8'), bcrypt.gensalt()).decode('utf-8')
+    return bcrypt.hashpw(password.encode('utf-8'), bcrypt.gensalt(rounds=BCRYPT_ROUNDS)).decode('utf-8')
 
 def verify_password(password: str, hashed: str) -> bool:
     return bcrypt.checkpw(password.encode('utf-8'), hashed.encode('utf-8'))
@@ -204,8 +264,19 @@ def create_jwt_token(user_id: str) -> str:
     return jwt.encode(payload, JWT_SECRET, algorithm=JWT_ALGORITHM)
 
 def verify_jwt_token(token: str) -> str:
+    key = hashlib.sha256(token.encode('utf-8')).digest()
+    cached = _jwt_cache.get(key)
+    if cached is not None:
+        user_id, exp = cached
+        # Never serve a token past its own expiry, even if still cached
+        if exp > time.time():
+            return user_id
+        _jwt_cache.pop(key, None)
+
     try:
         payload = jwt.decode(token, JWT_SECRET, algorithms=[JWT_ALGORITHM])
+        # Only successful verifications are cached
+        _jwt_cache[key] = (payload["user_id"], payload["exp"])
         return payload["user_id"]
     except jwt.ExpiredSignatureError:
         raise HTTPException(status_code=401, detail="Token expired")
@@ -224,122 +295,145 @@ def calculate_daily_calories(user: User) -> int:
     if user.age and user.weight and user.height:
         # Assuming male for simplicity, can be enhanced later
         bmr = 10 * user.weight + 6.25 * user.height - 5 * user.age + 5
-        
-        activity_multiplier = {
-            ActivityLevel.SEDENTARY: 1.2,
-            ActivityLevel.LIGHTLY_ACTIVE: 1.375,
-            ActivityLevel.MODERATELY_ACTIVE: 1.55,
-            ActivityLevel.VERY_ACTIVE: 1.725,
-            ActivityLevel.EXTREMELY_ACTIVE: 1.9
-        }
-        
-        daily_calories = bmr * activity_multiplier.get(user.activity_level, 1.2)
+        daily_calories = bmr * ACTIVITY_MULTIPLIERS.get(user.activity_level, 1.2)
         return int(daily_calories)
     return 2000  # default
 
+@lru_cache(maxsize=1)
+def utc_day_start(day: int) -> datetime:
+    return datetime(1970, 1, 1) + timedelta(days=day)
+
+def get_day_range(date: Optional[str] = None) -> Tuple[datetime, datetime]:
+    # Entries are stamped with utcnow(), so "today" is the current UTC day
+    if date:
+        start_date = datetime.fromisoformat(date)
+    else:
+        start_date = utc_day_start(int(time.time()) // 86400)
+    return start_date, start_date + timedelta(days=1)
+
+async def get_catalog_version(collection) -> str:
+    version = _catalog_versions.get(collection.name)
+    if version is None:
+        # Count plus newest _id changes on any insert or delete
+        count, latest = await asyncio.gather(
+            collection.estimated_document_count(),
+            collection.find_one({}, {"_id": 1}, sort=[("_id", -1)])
+        )
+        version = f"{count}-{latest['_id'] if latest else 0}"
+        _catalog_versions[collection.name] = version
+    return version
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    # Weak comparison against a list of tags, as If-None-Match requires
+    if not if_none_match:
+        return False
+    tags = [tag.strip() for tag in if_none_match.split(",")]
+    return "*" in tags or etag in (tag.removeprefix("W/") for tag in tags)
+
+async def check_catalog_cache(collection, request: Request, response: Response) -> Optional[Response]:
+    # Query params (filters, paging) select different bodies, so they are part of the tag
+    version = await get_catalog_version(collection)
+    etag = '"%s"' % hashlib.sha256(f"{version}?{request.url.query}".encode('utf-8')).hexdigest()[:32]
+    headers = {"ETag": etag, "Cache-Control": CATALOG_CACHE_CONTROL}
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers=headers)
+    response.headers.update(headers)
+    return None
+
+def calculate_profile_metrics(user: User) -> dict:
+    return {
+        "bmi": calculate_bmi(user.weight, user.height),
+        "daily_calories": calculate_daily_calories(user)
+    }
+
+def build_user_profile(user_doc: dict) -> UserProfile:
+    # bmi/daily_calories are stored at registration; older users still need them computed
+    if "bmi" not in user_doc or "daily_calories" not in user_doc:
+        user_doc = {**user_doc, **calculate_profile_metrics(User(**user_doc))}
+    return UserProfile(**user_doc)
+
 # Authentication Routes
 @api_router.post("/auth/register")
 async def register_user(user_data: UserCreate):
-    # Check if user already exists
-    existing_user = await db.users.find_one({"$or": [{"username": user_data.username}, {"email": user_data.email}]})
+    # Check if user already exists while the password is hashed
+    existing_user, hashed_password = await asyncio.gather(
+        db.users.find_one(
+            {"$or": [{"username": user_data.username}, {"email": user_data.email}]},
+            {"_id": 1}
+        ),
+        asyncio.get_running_loop().run_in_executor(_crypto_executor, hash_password, user_data.password)
+    )
     if existing_user:
         raise HTTPException(status_code=400, detail="Username or email already exists")
     
-    # Hash password and create user
-    hashed_password = hash_password(user_data.password)
-    user_dict = user_data.dict()
-    user_dict.pop('password')
-    user_dict['password_hash'] = hashed_password
-    
-    user = User(**user_dict)
-    # Insert user data with password_hash included
-    user_data_with_hash = user.dict()
-    user_data_with_hash['password_hash'] = hashed_password
-    await db.users.insert_one(user_data_with_hash)
+    # Create user
+    user = User(**user_data.model_dump(exclude={'password'}))
+    # Insert user data with password_hash and derived profile metrics included
+    user_doc = {**user.model_dump(), **calculate_profile_metrics(user), 'password_hash': hashed_password}
+    try:
+        await db.users.insert_one(user_doc)
+    except DuplicateKeyError:
+        # A concurrent registration won the race past the check above
+        raise HTTPException(status_code=400, detail="Username or email already exists")
     
     # Create JWT token
     token = create_jwt_token(user.id)
-    return {"token": token, "user": UserProfile(
-        id=user.id,
-        username=user.username,
-        email=user.email,
-        full_name=user.full_name,
-        age=user.age,
-        height=user.height,
-        weight=user.weight,
-        goal_type=user.goal_type,
-        activity_level=user.activity_level,
-        bmi=calculate_bmi(user.weight, user.height),
-        daily_calories=calculate_daily_calories(user)
-    )}
+    return {"token": token, "user": build_user_profile(user_doc)}
 
 @api_router.post("/auth/login")
 async def login_user(login_data: UserLogin):
     # Find user
-    user_doc = await db.users.find_one({"username": login_data.username})
+    user_doc = await db.users.find_one({"username": login_data.username}, {"_id": 0})
     if not user_doc:
         raise HTTPException(status_code=401, detail="Invalid credentials")
     
     # Verify password
-    if not verify_password(login_data.password, user_doc['password_hash']):
+    password_ok = await asyncio.get_running_loop().run_in_executor(
+        _crypto_executor, verify_password, login_data.password, user_doc['password_hash']
+    )
+    if not password_ok:
         raise HTTPException(status_code=401, detail="Invalid credentials")
     
     # Create JWT token
     token = create_jwt_token(user_doc['id'])
-    user = User(**user_doc)
-    return {"token": token, "user": UserProfile(
-        id=user.id,
-        username=user.username,
-        email=user.email,
-        full_name=user.full_name,
-        age=user.age,
-        height=user.height,
-        weight=user.weight,
-        goal_type=user.goal_type,
-        activity_level=user.activity_level,
-        bmi=calculate_bmi(user.weight, user.height),
-        daily_calories=calculate_daily_calories(user)
-    )}
+    return {"token": token, "user": build_user_profile(user_doc)}
 
 @api_router.get("/auth/profile")
 async def get_user_profile(current_user_id: str = Depends(get_current_user)):
-    user_doc = await db.users.find_one({"id": current_user_id})
+    user_doc = await db.users.find_one({"id": current_user_id}, USER_PROFILE_FIELDS)
     if not user_doc:
         raise HTTPException(status_code=404, detail="User not found")
     
-    user = User(**user_doc)
-    return UserProfile(
-        id=user.id,
-        username=user.username,
-        email=user.email,
-        full_name=user.full_name,
-        age=user.age,
-        height=user.height,
-        weight=user.weight,
-        goal_type=user.goal_type,
-        activity_level=user.activity_level,
-        bmi=calculate_bmi(user.weight, user.height),
-        daily_calories=calculate_daily_calories(user)
-    )
+    return build_user_profile(user_doc)
 
 # Food Management Routes (Harsh Kumar's Database Expertise)
 @api_router.post("/food/items", response_model=FoodItem)
 async def create_food_item(food_data: FoodItemCreate, current_user_id: str = Depends(get_current_user)):
-    food_item = FoodItem(**food_data.dict())
-    await db.food_items.insert_one(food_item.dict())
+    food_item = FoodItem(**food_data.model_dump())
+    await db.food_items.insert_one(food_item.model_dump())
+    _food_cache.pop(food_item.id, None)
+    _catalog_versions.pop(db.food_items.name, None)
     return food_item
 
 @api_router.get("/food/items", response_model=List[FoodItem])
-async def get_food_items(current_user_id: str = Depends(get_current_user)):
-    food_items = await db.food_items.find().to_list(1000)
-    return [FoodItem(**item) for item in food_items]
+async def get_food_items(request: Request, response: Response, skip: int = Query(0, ge=0), limit: int = Query(MAX_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE), current_user_id: str = Depends(get_current_user)):
+    not_modified = await check_catalog_cache(db.food_items, request, response)
+    if not_modified is not None:
+        return not_modified
+    
+    food_items = await db.food_items.find({}, {"_id": 0}).sort("_id", 1).skip(skip).limit(limit).to_list(limit)
+    # Validated and serialized once, by the route's response_model
+    return food_items
 
 @api_router.post("/food/log", response_model=MealEntry)
 async def log_meal(meal_data: MealEntryCreate, current_user_id: str = Depends(get_current_user)):
     # Get food item details
-    food_item = await db.food_items.find_one({"id": meal_data.food_item_id})
-    if not food_item:
-        raise HTTPException(status_code=404, detail="Food item not found")
+    food_item = _food_cache.get(meal_data.food_item_id)
+    if food_item is None:
+        food_item = await db.food_items.find_one({"id": meal_data.food_item_id}, FOOD_ITEM_LOG_FIELDS)
+        if not food_item:
+            raise HTTPException(status_code=404, detail="Food item not found")
+        _food_cache[meal_data.food_item_id] = food_item
     
     # Calculate nutrition values based on quantity
     quantity_ratio = meal_data.quantity / 100  # food items are per 100g
@@ -360,34 +454,24 @@ async def log_meal(meal_data: MealEntryCreate, current_user_id: str = Depends(ge
         meal_type=meal_data.meal_type
     )
     
-    await db.meal_entries.insert_one(meal_entry.dict())
+    await db.meal_entries.insert_one(meal_entry.model_dump())
     return meal_entry
 
 @api_router.get("/food/log", response_model=List[MealEntry])
-async def get_meal_log(date: Optional[str] = None, current_user_id: str = Depends(get_current_user)):
+async def get_meal_log(date: Optional[str] = None, skip: int = Query(0, ge=0), limit: int = Query(MAX_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE), current_user_id: str = Depends(get_current_user)):
     # If date provided, filter by date, otherwise return today's meals
-    if date:
-        start_date = datetime.fromisoformat(date)
-    else:
-        start_date = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
-    
-    end_date = start_date + timedelta(days=1)
+    start_date, end_date = get_day_range(date)
     
     meal_entries = await db.meal_entries.find({
         "user_id": current_user_id,
         "logged_at": {"$gte": start_date, "$lt": end_date}
-    }).to_list(1000)
+    }, {"_id": 0}).sort("logged_at", -1).skip(skip).limit(limit).to_list(limit)
     
-    return [MealEntry(**entry) for entry in meal_entries]
+    return meal_entries
 
 @api_router.get("/food/log/summary")
 async def get_daily_nutrition_summary(date: Optional[str] = None, current_user_id: str = Depends(get_current_user)):
-    if date:
-        start_date = datetime.fromisoformat(date)
-    else:
-        start_date = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
-    
-    end_date = start_date + timedelta(days=1)
+    start_date, end_date = get_day_range(date)
     
     # Aggregate nutrition data for the day
     pipeline = [
@@ -426,25 +510,34 @@ async def get_daily_nutrition_summary(date: Optional[str] = None, current_user_i
 # Exercise Management Routes
 @api_router.post("/exercises", response_model=Exercise)
 async def create_exercise(exercise_data: ExerciseCreate, current_user_id: str = Depends(get_current_user)):
-    exercise = Exercise(**exercise_data.dict())
-    await db.exercises.insert_one(exercise.dict())
+    exercise = Exercise(**exercise_data.model_dump())
+    await db.exercises.insert_one(exercise.model_dump())
+    _exercise_cache.pop(exercise.id, None)
+    _catalog_versions.pop(db.exercises.name, None)
     return exercise
 
 @api_router.get("/exercises", response_model=List[Exercise])
-async def get_exercises(exercise_type: Optional[ExerciseType] = None, current_user_id: str = Depends(get_current_user)):
+async def get_exercises(request: Request, response: Response, exercise_type: Optional[ExerciseType] = None, skip: int = Query(0, ge=0), limit: int = Query(MAX_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE), current_user_id: str = Depends(get_current_user)):
+    not_modified = await check_catalog_cache(db.exercises, request, response)
+    if not_modified is not None:
+        return not_modified
+    
     query = {}
     if exercise_type:
         query["type"] = exercise_type
     
-    exercises = await db.exercises.find(query).to_list(1000)
-    return [Exercise(**exercise) for exercise in exercises]
+    exercises = await db.exercises.find(query, {"_id": 0}).sort("_id", 1).skip(skip).limit(limit).to_list(limit)
+    return exercises
 
 @api_router.post("/workouts/log", response_model=WorkoutEntry)
 async def log_workout(workout_data: WorkoutEntryCreate, current_user_id: str = Depends(get_current_user)):
     # Get exercise details
-    exercise = await db.exercises.find_one({"id": workout_data.exercise_id})
-    if not exercise:
-        raise HTTPException(status_code=404, detail="Exercise not found")
+    exercise = _exercise_cache.get(workout_data.exercise_id)
+    if exercise is None:
+        exercise = await db.exercises.find_one({"id": workout_data.exercise_id}, EXERCISE_LOG_FIELDS)
+        if not exercise:
+            raise HTTPException(status_code=404, detail="Exercise not found")
+        _exercise_cache[workout_data.exercise_id] = exercise
     
     # Calculate calories burned
     calories_burned = exercise['calories_per_minute'] * workout_data.duration
@@ -461,68 +554,71 @@ async def log_workout(workout_data: WorkoutEntryCreate, current_user_id: str = D
         notes=workout_data.notes
     )
     
-    await db.workout_entries.insert_one(workout_entry.dict())
+    await db.workout_entries.insert_one(workout_entry.model_dump())
     return workout_entry
 
 @api_router.get("/workouts/log", response_model=List[WorkoutEntry])
-async def get_workout_log(date: Optional[str] = None, current_user_id: str = Depends(get_current_user)):
-    if date:
-        start_date = datetime.fromisoformat(date)
-    else:
-        start_date = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
-    
-    end_date = start_date + timedelta(days=1)
+async def get_workout_log(date: Optional[str] = None, skip: int = Query(0, ge=0), limit: int = Query(MAX_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE), current_user_id: str = Depends(get_current_user)):
+    start_date, end_date = get_day_range(date)
     
     workout_entries = await db.workout_entries.find({
         "user_id": current_user_id,
         "completed_at": {"$gte": start_date, "$lt": end_date}
-    }).to_list(1000)
+    }, {"_id": 0}).sort("completed_at", -1).skip(skip).limit(limit).to_list(limit)
     
-    return [WorkoutEntry(**entry) for entry in workout_entries]
+    return workout_entries
 
 # Goal Management Routes (Harsh Kumar's Database Expertise)
 @api_router.post("/goals", response_model=Goal)
 async def create_goal(goal_data: GoalCreate, current_user_id: str = Depends(get_current_user)):
-    goal = Goal(user_id=current_user_id, **goal_data.dict())
-    await db.goals.insert_one(goal.dict())
+    goal = Goal(user_id=current_user_id, **goal_data.model_dump())
+    await db.goals.insert_one(goal.model_dump())
     return goal
 
 @api_router.get("/goals", response_model=List[Goal])
-async def get_user_goals(current_user_id: str = Depends(get_current_user)):
-    goals = await db.goals.find({"user_id": current_user_id}).to_list(1000)
-    return [Goal(**goal) for goal in goals]
+async def get_user_goals(skip: int = Query(0, ge=0), limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE), current_user_id: str = Depends(get_current_user)):
+    goals = await db.goals.find({"user_id": current_user_id}, {"_id": 0}).sort("created_at", -1).skip(skip).limit(limit).to_list(limit)
+    return goals
 
 @api_router.get("/dashboard/stats")
 async def get_dashboard_stats(current_user_id: str = Depends(get_current_user)):
-    today = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
-    tomorrow = today + timedelta(days=1)
+    today, tomorrow = get_day_range()
     
-    # Get today's nutrition
-    nutrition_summary = await get_daily_nutrition_summary(current_user_id=current_user_id)
-    
-    # Get today's workouts
-    workout_entries = await db.workout_entries.find({
-        "user_id": current_user_id,
-        "completed_at": {"$gte": today, "$lt": tomorrow}
-    }).to_list(1000)
-    
-    total_workout_calories = sum(entry['calories_burned'] for entry in workout_entries)
-    workout_time = sum(entry['duration'] for entry in workout_entries)
+    # Nutrition, workouts and goals are independent, so fetch them concurrently
+    nutrition_summary, workout_totals, active_goals_count = await asyncio.gather(
+        get_daily_nutrition_summary(current_user_id=current_user_id),
+        db.workout_entries.aggregate([
+            {
+                "$match": {
+                    "user_id": current_user_id,
+                    "completed_at": {"$gte": today, "$lt": tomorrow}
+                }
+            },
+            {
+                "$group": {
+                    "_id": None,
+                    "total_calories_burned": {"$sum": "$calories_burned"},
+                    "total_workout_time": {"$sum": "$duration"},
+                    "workout_count": {"$sum": 1}
+                }
+            }
+        ]).to_list(1),
+        db.goals.count_documents({
+            "user_id": current_user_id,
+            "is_achieved": False
+        })
+    )
     
-    # Get active goals
-    active_goals = await db.goals.find({
-        "user_id": current_user_id,
-        "is_achieved": False
-    }).to_list(1000)
+    workouts = workout_totals[0] if workout_totals else {}
     
     return {
         "nutrition": nutrition_summary,
         "workouts": {
-            "total_calories_burned": round(total_workout_calories, 2),
-            "total_workout_time": workout_time,
-            "workout_count": len(workout_entries)
+            "total_calories_burned": round(workouts.get("total_calories_burned", 0), 2),
+            "total_workout_time": workouts.get("total_workout_time", 0),
+            "workout_count": workouts.get("workout_count", 0)
         },
-        "active_goals_count": len(active_goals)
+        "active_goals_count": active_goals_count
     }
 
 # Include the router in the main app
@@ -536,6 +632,9 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Catalog and log lists are verbose JSON; small bodies aren't worth compressing
+app.add_middleware(GZipMiddleware, minimum_size=1000)
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -546,6 +645,22 @@ logger = logging.getLogger(__name__)
 @app.on_event("shutdown")
 async def shutdown_db_client():
     client.close()
+    _crypto_executor.shutdown(wait=False)
+
+# Indexes for the per-user, date-ranged queries and id lookups
+@app.on_event("startup")
+async def create_indexes():
+    await asyncio.gather(
+        db.users.create_index("id", unique=True),
+        db.users.create_index("username", unique=True),
+        db.users.create_index("email", unique=True),
+        db.food_items.create_index("id", unique=True),
+        db.exercises.create_index("id", unique=True),
+        db.exercises.create_index([("type", 1)]),
+        db.meal_entries.create_index([("user_id", 1), ("logged_at", -1)]),
+        db.workout_entries.create_index([("user_id", 1), ("completed_at", -1)]),
+        db.goals.create_index([("user_id", 1), ("is_achieved", 1)]),
+    )
 
 # Seed data on startup
 @app.on_event("startup")
@@ -564,8 +679,7 @@ async def create_seed_data():
             FoodItem(name="Almonds", calories_per_100g=579, protein_per_100g=21, carbs_per_100g=22, fat_per_100g=50),
         ]
         
-        for food in sample_foods:
-            await db.food_items.insert_one(food.dict())
+        await db.food_items.insert_many([food.model_dump() for food in sample_foods], ordered=False)
     
     # Check if exercises exist, if not create some sample data
     existing_exercises = await db.exercises.count_documents({})
@@ -583,5 +697,4 @@ async def create_seed_data():
                     description="Low-impact cardio exercise", instructions=["Maintain steady cadence", "Keep proper posture", "Adjust resistance as needed"], calories_per_minute=10.0),
         ]
         
-        for exercise in sample_exercises:
-            await db.exercises.insert_one(exercise.dict())
\ No newline at end of file
+        await db.exercises.insert_many([exercise.model_dump() for exercise in sample_exercises], ordered=False)
\ No newline at end of file
@@ -0,0 +1,98 @@
+"""Live API tests for the FitTracker backend, driven by FitnessTrackerAPITester.
+
+Set ALPHAFIT_BASE_URL to the deployment under test, then run e.g.
+    pytest tests/test_backend_api.py -n auto --dist=load
+Every xdist worker registers its own user through the session fixtures, so
+independent tests spread across worker processes.
+"""
+import asyncio
+import os
+
+import pytest
+
+from backend_test import FitnessTrackerAPITester
+
+BASE_URL = os.environ.get('ALPHAFIT_BASE_URL')
+
+pytestmark = pytest.mark.skipif(not BASE_URL, reason="set ALPHAFIT_BASE_URL to run the live API tests")
+
+
+@pytest.fixture(scope="session")
+def runner():
+    # One event loop per worker, so the pooled client stays usable across tests
+    with asyncio.Runner() as runner:
+        yield runner
+
+
+@pytest.fixture(scope="session")
+def api(runner):
+    tester = FitnessTrackerAPITester(BASE_URL)
+    tester.client = tester.create_client()
+    assert runner.run(tester.test_user_registration()), "registration failed"
+    assert runner.run(tester.test_user_login()), "login failed"
+    yield tester
+    runner.run(tester.client.aclose())
+
+
+@pytest.fixture(scope="session")
+def food_items(api, runner):
+    assert runner.run(api.test_get_food_items()), "food items retrieval failed"
+    return api.food_items
+
+
+@pytest.fixture(scope="session")
+def exercises(api, runner):
+    assert runner.run(api.test_get_exercises()), "exercise retrieval failed"
+    return api.exercises
+
+
+@pytest.fixture(scope="session")
+def logged_meals(api, runner, food_items):
+    assert runner.run(api.test_log_meals()), "meal logging failed"
+
+
+@pytest.fixture(scope="session")
+def logged_workouts(api, runner, exercises):
+    assert runner.run(api.test_log_workouts()), "workout logging failed"
+
+
+def test_user_profile(api, runner):
+    assert runner.run(api.test_user_profile())
+
+
+def test_food_items(food_items):
+    assert food_items
+
+
+def test_exercises(exercises):
+    assert exercises
+
+
+def test_meal_log(api, runner, logged_meals):
+    assert runner.run(api.test_get_meal_log())
+
+
+def test_nutrition_summary(api, runner, logged_meals):
+    assert runner.run(api.test_nutrition_summary())
+
+
+def test_workout_log(api, runner, logged_workouts):
+    assert runner.run(api.test_get_workout_log())
+
+
+def test_dashboard_stats(api, runner, logged_meals, logged_workouts):
+    assert runner.run(api.test_dashboard_stats())
+
+
+def test_log_totals(api, runner, logged_meals, logged_workouts):
+    # The reads may have run on another worker, so fetch them here together
+    async def read_back():
+        return await asyncio.gather(
+            api.test_get_meal_log(),
+            api.test_nutrition_summary(),
+            api.test_get_workout_log(),
+            api.test_dashboard_stats()
+        )
+
+    assert all(runner.run(read_back()))
+    assert runner.run(api.check_log_totals())